@@ -127,6 +127,24 @@ class OperatorPDCholeskyTest(tf.test.TestCase):
                          sqrt_operator_times_x.get_shape())
         self.assertAllClose(expected.eval(), sqrt_operator_times_x.eval())
 
+  def test_sqrt_solve_broadcast_leading_dims(self):
+    with self.test_session():
+      batch_shape = (2, 3)
+      for k in [1, 4]:
+        x_shape = (4,) + batch_shape + (k, k)
+        x = self._rng.rand(*x_shape)
+        chol_shape = batch_shape + (k, k)
+        chol = self._random_cholesky_array(chol_shape)
+
+        operator = operator_pd_cholesky.OperatorPDCholesky(chol)
+
+        soln = operator.sqrt_solve_broadcast(x)
+        expected = tf.batch_matrix_triangular_solve(
+            np.tile(chol, (4, 1, 1, 1, 1)), x, lower=True)
+
+        self.assertEqual(expected.get_shape(), soln.get_shape())
+        self.assertAllClose(expected.eval(), soln.eval())
+
   def test_matmul_single_matrix(self):
     with self.test_session():
       batch_shape = ()
@@ -20,8 +20,11 @@ from __future__ import print_function
 
 import numpy as np
 from scipy import linalg
+from scipy import special
 import tensorflow as tf
 
+from tensorflow.contrib.distributions.python.ops import wishart
+
 distributions = tf.contrib.distributions
 
 
@@ -151,6 +154,27 @@ class WishartCholeskyTest(tf.test.TestCase):
                           variance_estimate,
                           rtol=0.05)
 
+  def testChunkedSample(self):
+    # Shrink the per-intermediate memory budget so n=25 takes the chunked
+    # sampling path, several chunks of 7 observations each.
+    original_budget = wishart._MAX_SAMPLE_CHUNK_BYTES
+    wishart._MAX_SAMPLE_CHUNK_BYTES = 7 * 3 * 3 * 8
+    try:
+      with self.test_session():
+        chol_w = distributions.WishartCholesky(
+            df=4.,
+            scale=chol(make_pd(1., 3)),
+            cholesky_input_output_matrices=False)
+        self.assertEqual(7, chol_w._sample_chunk_size())
+        x = chol_w.sample_n(25, seed=42)
+        self.assertAllEqual((25, 3, 3), x.get_shape())
+        x_val = x.eval()
+        self.assertAllEqual((25, 3, 3), x_val.shape)
+        # Each chunk must draw fresh variates; no observation repeats.
+        self.assertEqual(25, len(set(x_val[:, 0, 0])))
+    finally:
+      wishart._MAX_SAMPLE_CHUNK_BYTES = original_budget
+
   def testProb(self):
     with self.test_session():
       # Generate some positive definite (pd) matrices and their Cholesky
@@ -239,6 +263,97 @@ class WishartCholeskyTest(tf.test.TestCase):
             (2, 2),
             w.log_prob(np.reshape(x, (2, 2, 2, 2))).get_shape())
 
+  def testDigammaHelper(self):
+    # The scalar digamma used for construction-time constant folding should
+    # match scipy over the argument range produced by valid (df, dimension).
+    for x in [0.5, 0.75, 1., 1.5, 2., 3.14, 6., 42., 100.5]:
+      self.assertAllClose(special.psi(x), wishart._digamma(x))
+
+  def testMultiGammaConstantFolding(self):
+    with self.test_session() as sess:
+      # Static df/scale: entropy should fold the (di)gamma sums into
+      # constants and still agree with the deferred-input graph path.
+      scale = make_pd(1., 3)
+      w_static = distributions.WishartCholesky(df=5., scale=chol(scale))
+
+      df_deferred = tf.placeholder(tf.float64)
+      w_dynamic = distributions.WishartCholesky(
+          df=df_deferred, scale=chol(scale))
+
+      self.assertAllClose(
+          w_static.entropy().eval(),
+          sess.run(w_dynamic.entropy(), feed_dict={df_deferred: 5.}))
+
+  def testScalarWishartIsGamma(self):
+    with self.test_session():
+      df = 4.
+      scale = 3.
+      x = np.array([0.5, 2.7, 10.])
+      x_mat = x[..., np.newaxis, np.newaxis]
+
+      # Closed-form Gamma(alpha=df/2, beta=1/(2*scale)) log-pdf.
+      expected = ((0.5 * df - 1.) * np.log(x) - 0.5 * x / scale -
+                  0.5 * df * np.log(2. * scale) - special.gammaln(0.5 * df))
+
+      w = distributions.WishartCholesky(df=df, scale=[[np.sqrt(scale)]])
+      self.assertAllClose(expected, w.log_prob(x_mat).eval())
+      self.assertAllEqual((3,), w.log_prob(x_mat).get_shape())
+
+      w_chol = distributions.WishartCholesky(
+          df=df, scale=[[np.sqrt(scale)]],
+          cholesky_input_output_matrices=True)
+      self.assertAllClose(expected, w_chol.log_prob(np.sqrt(x_mat)).eval())
+
+      samples = w.sample_n(10000, seed=42)
+      self.assertAllEqual((10000, 1, 1), samples.get_shape())
+      self.assertAllClose(df * scale,
+                          tf.reduce_mean(samples).eval(),
+                          rtol=0.05)
+
+  def testComputeDtype(self):
+    with self.test_session():
+      x = make_pd(1., 2)
+      df = 4
+
+      w = distributions.WishartCholesky(df, chol(make_pd(1., 2)))
+      w_f16 = distributions.WishartCholesky(
+          df, chol(make_pd(1., 2)), compute_dtype=tf.float16)
+      self.assertEqual(tf.float16, w_f16.compute_dtype)
+      # Only the square of the whitened observation runs in half precision,
+      # so log_prob should agree to roughly half-precision tolerance.
+      self.assertAllClose(
+          w.log_prob(x).eval(), w_f16.log_prob(x).eval(), rtol=1e-2)
+
+      # BatchMatMul has no half-precision CPU kernel, so exercise the
+      # sample_n cast path with double.
+      w_f64 = distributions.WishartCholesky(
+          df, chol(make_pd(1., 2)), compute_dtype=tf.float64)
+      self.assertAllClose(
+          w.sample_n(1, seed=42).eval(),
+          w_f64.sample_n(1, seed=42).eval(),
+          rtol=1e-5)
+
+      with self.assertRaisesRegexp(TypeError, 'floating-point'):
+        distributions.WishartCholesky(
+            df, chol(make_pd(1., 2)), compute_dtype=tf.int32)
+
+  def testBlockedCholesky(self):
+    with self.test_session():
+      x = np.array([make_pd(1., 5), make_pd(2., 5)])
+      expected = np.array([chol(x[0]), chol(x[1])])
+
+      # A block size below the dimension forces the blocked TRSM/GEMM path.
+      self.assertAllClose(
+          expected,
+          wishart._blocked_batch_cholesky(
+              tf.constant(x), block_size=2).eval())
+
+      # At or above the dimension it falls back to the monolithic kernel.
+      self.assertAllClose(
+          expected,
+          wishart._blocked_batch_cholesky(
+              tf.constant(x), block_size=5).eval())
+
   def testBatchShape(self):
     with self.test_session() as sess:
       scale = make_pd(1., 2)
@@ -594,6 +594,67 @@ class OperatorPDBase(object):
     raise NotImplementedError(
         'batch sqrt_solve not implemented for this Operator.')
 
+  def sqrt_solve_broadcast(self, rhs, name='sqrt_solve_broadcast'):
+    """Solve `S X = rhs` where `rhs` has extra leading dimensions.
+
+    `rhs` is a batch matrix with compatible shape if
+
+    ```python
+    self.shape = [N1,...,Nn] + [k, k]
+    rhs.shape = [M1,...,Mm] + [N1,...,Nn] + [k, r]
+    ```
+
+    i.e., unlike `sqrt_solve`, `rhs` may carry `m >= 0` extra leading "sample"
+    dimensions which broadcast against this operator.
+
+    Args:
+      rhs: `Tensor` with same `dtype` as this operator and compatible shape,
+        `rhs.shape = [M1,...,Mm] + self.shape[:-1] + [r]` for `r >= 1`.
+      name:  A name scope to use for ops added by this method.
+
+    Returns:
+      `Tensor` with same `dtype` and shape as `rhs`.
+    """
+    with ops.name_scope(self.name):
+      with ops.name_scope(name, values=[rhs] + self.inputs):
+        rhs = ops.convert_to_tensor(rhs, name='rhs')
+        return self._sqrt_solve_broadcast(rhs)
+
+  def _sqrt_solve_broadcast(self, rhs):
+    # Re-implement in derived class if the extra leading dimensions can be
+    # handled without data movement, e.g. by a solve which itself broadcasts.
+    #
+    # As implemented here, the leading dimensions of `rhs` are flipped into
+    # the trailing dimension so that `sqrt_solve` sees one system per batch
+    # member with a wide right-hand side, then the flip is undone.  Each flip
+    # is a transpose + reshape, i.e., O(size(rhs)) data movement.
+    batch_shape = self.batch_shape()
+    rhs_shape = array_ops.shape(rhs)
+    ndims = array_ops.rank(rhs)
+    sample_ndims = ndims - array_ops.size(batch_shape) - 2
+
+    # Make batch-op ready, giving shape batch_shape + [k, r * M1*...*Mm].
+    perm = array_ops.concat(0, (math_ops.range(sample_ndims, ndims),
+                                math_ops.range(0, sample_ndims)))
+    x = array_ops.transpose(rhs, perm)
+    shape = array_ops.concat(
+        0, (batch_shape, (array_ops.gather(rhs_shape, ndims - 2), -1)))
+    x = array_ops.reshape(x, shape)
+
+    x = self.sqrt_solve(x)
+
+    # Undo make batch-op ready.
+    shape = array_ops.concat(
+        0, (batch_shape,
+            array_ops.slice(rhs_shape, [ndims - 2], [2]),
+            array_ops.slice(rhs_shape, [0], [sample_ndims])))
+    x = array_ops.reshape(x, shape)
+    perm = array_ops.concat(0, (math_ops.range(ndims - sample_ndims, ndims),
+                                math_ops.range(0, ndims - sample_ndims)))
+    x = array_ops.transpose(x, perm)
+    x.set_shape(rhs.get_shape())
+    return x
+
   def to_dense(self, name='to_dense'):
     """Return a dense (batch) matrix representing this operator."""
     with ops.name_scope(self.name):
@@ -19,6 +19,7 @@ from __future__ import division
 from __future__ import print_function
 
 from tensorflow.contrib.distributions.python.ops import operator_pd
+from tensorflow.python.framework import dtypes
 from tensorflow.python.framework import ops
 from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import check_ops
@@ -155,6 +156,46 @@ class OperatorPDCholesky(operator_pd.OperatorPDBase):
   def _batch_sqrt_solve(self, rhs):
     return linalg_ops.batch_matrix_triangular_solve(self._chol, rhs, lower=True)
 
+  def _sqrt_solve_broadcast(self, rhs):
+    # The Cholesky factor is materialized, so rather than flipping the extra
+    # leading dimensions of `rhs` into the trailing dimension (two
+    # O(size(rhs)) data movements), tile the factor across the leading
+    # dimensions and do one batched triangular solve.
+    chol = self._chol
+    static_chol_shape = chol.get_shape()
+    static_rhs_shape = rhs.get_shape()
+    if (static_chol_shape.is_fully_defined() and
+        static_rhs_shape.ndims is not None and
+        static_rhs_shape[
+            :static_rhs_shape.ndims -
+            static_chol_shape.ndims].is_fully_defined()):
+      # Shapes are static; build the reshape target and tile multiples as
+      # Python lists rather than shape/rank/concat ops.
+      sample_dims = static_rhs_shape.as_list()[
+          :static_rhs_shape.ndims - static_chol_shape.ndims]
+      chol = array_ops.reshape(
+          chol, [1] * len(sample_dims) + static_chol_shape.as_list())
+      chol = array_ops.tile(
+          chol, sample_dims + [1] * static_chol_shape.ndims)
+    else:
+      chol_shape = array_ops.shape(chol)
+      chol_ndims = array_ops.rank(chol)
+      sample_ndims = array_ops.rank(rhs) - chol_ndims
+
+      # Shape the factor as [1,...,1] + batch_shape + [k, k], then tile the
+      # leading singleton dimensions to match `rhs`.
+      shape = array_ops.concat(
+          0, (array_ops.ones([sample_ndims], dtype=dtypes.int32), chol_shape))
+      chol = array_ops.reshape(chol, shape)
+      multiples = array_ops.concat(
+          0, (array_ops.slice(array_ops.shape(rhs), [0], [sample_ndims]),
+              array_ops.ones([chol_ndims], dtype=dtypes.int32)))
+      chol = array_ops.tile(chol, multiples)
+
+    x = linalg_ops.batch_matrix_triangular_solve(chol, rhs, lower=True)
+    x.set_shape(rhs.get_shape())
+    return x
+
   def get_shape(self):
     """`TensorShape` giving static shape."""
     return self._chol.get_shape()
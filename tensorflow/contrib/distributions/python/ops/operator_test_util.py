@@ -158,6 +158,25 @@ class OperatorPDDerivedClassTest(tf.test.TestCase):
               expected=tf.batch_matrix_solve(mat, x).eval(),
               actual=operator.sqrt_solve(operator.sqrt_solve(x)))
 
+  def test_sqrt_solve_broadcast(self):
+    # Should behave like sqrt_solve, with extra leading "sample" dimensions
+    # broadcast against the operator.
+    with self.test_session():
+      for batch_shape in [(), (2, 3,)]:
+        for k in [1, 4]:
+          operator, mat = self._build_operator_and_mat(batch_shape, k)
+
+          # Work with 4 simultaneous systems per batch member, carried in an
+          # extra leading dimension.  4 is arbitrary.
+          x = self._rng.randn(*((4,) + batch_shape + (k, k)))
+
+          # As in test_sqrt_solve, S = S^T here, so
+          # S^{-1} S^{-1} x = A^{-1} x, now for every leading index.
+          self._compare_results(
+              expected=np.linalg.solve(mat, x),
+              actual=operator.sqrt_solve_broadcast(
+                  operator.sqrt_solve_broadcast(x)))
+
   def test_add_to_tensor(self):
     with self.test_session():
       for batch_shape in [(), (2, 3,)]:
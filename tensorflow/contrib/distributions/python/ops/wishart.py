@@ -36,6 +36,151 @@ from tensorflow.python.ops import control_flow_ops
 from tensorflow.python.ops import linalg_ops
 from tensorflow.python.ops import math_ops
 from tensorflow.python.ops import random_ops
+from tensorflow.python.ops import tensor_array_ops
+
+
+# Trailing-block size at or below which _blocked_batch_cholesky hands the
+# whole factorization to the monolithic batch_cholesky kernel.
+_CHOLESKY_BLOCK_SIZE = 64
+
+# Rough per-intermediate budget for sample_n; when a statically-known `n`
+# would push a single sample tensor past this, sampling proceeds in chunks
+# inside a while_loop so peak memory stays bounded by the chunk size.
+_MAX_SAMPLE_CHUNK_BYTES = 256 * 1024 * 1024
+
+
+def _digamma(x):
+  """Scalar digamma function; Psi(x) for `x > 0`.
+
+  Python counterpart of `math.lgamma` for the derivative, via the recurrence
+  `Psi(x) = Psi(x + 1) - 1/x` followed by the asymptotic (Bernoulli) series.
+  Used for construction-time constant folding only; accurate to ~1e-12 over
+  the arguments arising from valid `(df, dimension)` pairs.
+  """
+  result = 0.
+  while x < 6.:
+    result -= 1. / x
+    x += 1.
+  inv = 1. / x
+  inv2 = inv * inv
+  return result + math.log(x) - 0.5 * inv - inv2 * (
+      1. / 12. - inv2 * (1. / 120. - inv2 * (1. / 252. - inv2 * (
+          1. / 240. - inv2 / 132.))))
+
+
+def _blocked_batch_cholesky(x, block_size=_CHOLESKY_BLOCK_SIZE):
+  """Blocked (batch) Cholesky factorization built from TRSM + GEMM updates.
+
+  The monolithic `batch_cholesky` kernel factors each matrix in one
+  LAPACK-style call.  For larger `k` a right-looking blocked factorization
+  exposes most of the flops as batched triangular solves and symmetric rank-k
+  (GEMM) updates, which parallelize far better:
+
+  ```
+  A = [[A11, .  ],      L11 = chol(A11)
+       [A21, A22]]      L21 = A21 inv(L11)^T
+                        L22 = chol(A22 - L21 L21^T)
+  ```
+
+  This requires the shape of `x` to be statically known; otherwise, or when
+  the trailing dimension is at most `block_size`, the monolithic kernel is
+  used directly.
+
+  Args:
+    x: `Tensor` of shape `[..., k, k]` representing (batch) symmetric positive
+      definite matrices.
+    block_size: Python integer; size of the leading block factored per
+      recursion.
+
+  Returns:
+    `Tensor` holding the (batch) lower Cholesky factors of `x`.
+  """
+  ndims = x.get_shape().ndims
+  k = x.get_shape()[-1].value if ndims is not None else None
+  if k is None or k <= block_size:
+    return linalg_ops.batch_cholesky(x)
+  batch_ndims = ndims - 2
+  # Absorb any remainder mod 4 into the leading block so that every TRSM and
+  # GEMM in the recursion below runs on dimensions that are multiples of 4,
+  # keeping the batched kernels on aligned, constant strides.
+  m = block_size + k % 4
+  if m >= k:
+    return linalg_ops.batch_cholesky(x)
+
+  def block(i, j, rows, cols):
+    begin = [0] * batch_ndims + [i, j]
+    size = [-1] * batch_ndims + [rows, cols]
+    return array_ops.slice(x, begin, size)
+
+  matrix_transpose_perm = list(range(batch_ndims)) + [ndims - 1, ndims - 2]
+
+  a11 = block(0, 0, m, m)
+  a21 = block(m, 0, k - m, m)
+  a22 = block(m, m, k - m, k - m)
+
+  l11 = linalg_ops.batch_cholesky(a11)
+
+  # L21 = A21 inv(L11)^T, i.e., L11 L21^T = A21^T: a batched TRSM.
+  l21_t = linalg_ops.batch_matrix_triangular_solve(
+      l11, array_ops.transpose(a21, matrix_transpose_perm), lower=True)
+  l21 = array_ops.transpose(l21_t, matrix_transpose_perm)
+
+  # Symmetric rank-m (GEMM) update of the trailing block, then recurse.
+  l22 = _blocked_batch_cholesky(
+      a22 - math_ops.batch_matmul(l21, l21, adj_y=True), block_size=block_size)
+
+  top = array_ops.concat(ndims - 1, (l11, array_ops.zeros_like(l21_t)))
+  bottom = array_ops.concat(ndims - 1, (l21, l22))
+  return array_ops.concat(ndims - 2, (top, bottom))
+
+
+def _symmetric_square(x, compute_dtype=None):
+  """Computes `x x^T`, a batched symmetric rank-k (SYRK-style) product.
+
+  Where this is used `x` is lower-triangular, so a true batched SYRK kernel
+  writing only one triangle would halve the flops; no such primitive exists
+  in this tree, so the product falls back to a full GEMM.  Kept as the single
+  seam to swap if a structured batched product becomes available.
+
+  Args:
+    x: `Tensor` of shape `[..., k, k]`.
+    compute_dtype: Optional `DType`.  If set, run the GEMM in this precision
+      and cast the result back to `x.dtype`; the product is symmetric
+      positive semi-definite regardless of rounding in the factor.
+
+  Returns:
+    `Tensor` with the same `dtype` and batch shape as `x` holding `x x^T`.
+  """
+  if compute_dtype is not None:
+    x_c = math_ops.cast(x, compute_dtype)
+    return math_ops.cast(
+        math_ops.batch_matmul(x_c, x_c, adj_y=True), x.dtype)
+  return math_ops.batch_matmul(x, x, adj_y=True)
+
+
+def _batch_cholesky_with_half_log_det(x):
+  """Computes `chol(x)` along with `sum(log(diag(chol(x))))`.
+
+  The diagonal of the Cholesky factor is already known during factorization,
+  so a fused kernel could emit the log-determinant as a side output.  Lacking
+  such an op, computing the reduction directly off the freshly produced factor
+  at least keeps the extra O(nbk) pass adjacent to its producer, before any
+  downstream data movement.
+
+  Args:
+    x: `Tensor` of shape `[..., k, k]` representing (batch) symmetric positive
+      definite matrices.
+
+  Returns:
+    x_sqrt: `Tensor` holding the (batch) Cholesky factors of `x`.
+    half_log_det: `Tensor` of shape `x.shape[:-2]`; half the log determinant
+      of `x`, i.e., `sum(log(diag(x_sqrt)))`.
+  """
+  x_sqrt = _blocked_batch_cholesky(x)
+  half_log_det = math_ops.reduce_sum(
+      math_ops.log(array_ops.batch_matrix_diag_part(x_sqrt)),
+      reduction_indices=[-1])
+  return x_sqrt, half_log_det
 
 
 class _WishartOperatorPD(distribution.Distribution):
@@ -62,6 +207,17 @@ class _WishartOperatorPD(distribution.Distribution):
 
   where `Gamma_k` is the multivariate Gamma function.
 
+  #### Device placement
+
+  Most of the ops backing `sample_n` and `log_prob` (batched matmul,
+  band-part/diag manipulation, normal sampling, elementwise math) have GPU
+  kernels, but `BatchCholesky`, `BatchMatrixTriangularSolve` and
+  `RandomGamma` are currently CPU-only, so graphs placed on a GPU will incur
+  transfers around those ops.  With `cholesky_input_output_matrices=True`
+  and a `WishartCholesky` scale, `log_prob` avoids the Cholesky entirely and
+  `sample_n` avoids the closing matmul's squaring, which keeps the CPU-bound
+  portion to the triangular solve and the O(nbk) gamma draw.
+
   #### Examples
 
   See `WishartFull`, `WishartCholesky` for examples of initializing and using
@@ -74,6 +230,7 @@ class _WishartOperatorPD(distribution.Distribution):
                cholesky_input_output_matrices=False,
                allow_nan_stats=False,
                validate_args=True,
+               compute_dtype=None,
                name='Wishart'):
     """Construct Wishart distributions.
 
@@ -93,17 +250,32 @@ class _WishartOperatorPD(distribution.Distribution):
       validate_args: Whether to validate input with asserts. If `validate_args`
         is `False`, and the inputs are invalid, correct behavior is not
         guaranteed.
+      compute_dtype: Optional floating-point `DType`, e.g. `dtypes.float16`.
+        If set, the largest dtype-safe intermediates of `log_prob` and
+        `sample_n` (the elementwise square of the whitened observations and
+        the closing matmul of `sample_n`) are computed in this precision;
+        reductions and results stay in `self.dtype`.  Solves and matmuls that
+        go through `scale_operator_pd` keep `self.dtype` since the operator
+        fixes their dtype.  Useful for large-batch Monte-Carlo workloads.
+        Default: `None`, i.e., compute everything in `self.dtype`.
       name: The name to give Ops created by the initializer.
 
     Raises:
       TypeError: if scale is not floating-type
       TypeError: if scale.dtype != df.dtype
+      TypeError: if compute_dtype is not a floating-point type
       ValueError: if df < k, where scale operator event shape is `(k, k)`
     """
     self._scale_operator_pd = scale_operator_pd
     self._cholesky_input_output_matrices = cholesky_input_output_matrices
     self._allow_nan_stats = allow_nan_stats
     self._validate_args = validate_args
+    if compute_dtype is not None:
+      compute_dtype = dtypes.as_dtype(compute_dtype)
+      if not compute_dtype.is_floating:
+        raise TypeError(
+            'compute_dtype=%s is not a floating-point type' % compute_dtype)
+    self._compute_dtype = compute_dtype
     self._name = name
     with ops.name_scope(name):
       with ops.name_scope('init', values=[df, scale_operator_pd]):
@@ -125,14 +297,15 @@ class _WishartOperatorPD(distribution.Distribution):
               dtype=self.dtype, name='dimension')
         df_val = tensor_util.constant_value(self.df)
         dim_val = tensor_util.constant_value(self.dimension)
+        self._dimension_static = dim_val
         if df_val is not None and dim_val is not None:
-          df_val = np.asarray(df_val)
-          if not df_val.shape: df_val = (df_val,)
-          if any(df_val < dim_val):
+          df_arr = np.asarray(df_val)
+          if not df_arr.shape: df_arr = (df_arr,)
+          if any(df_arr < dim_val):
             raise ValueError(
                 'Degrees of freedom (df = %s) cannot be less than dimension of '
                 'scale matrix (scale.dimension = %s)'
-                % (df_val, dim_val))
+                % (df_arr, dim_val))
         elif self.validate_args:
           assertions = check_ops.assert_less_equal(
               self.dimension, self.df,
@@ -141,6 +314,29 @@ class _WishartOperatorPD(distribution.Distribution):
                        (self.dimension, self.df)))
           self._df = control_flow_ops.with_dependencies([assertions], self._df)
 
+        # Cache quantities which depend only on (df, scale) so that repeated
+        # log_prob/sample_n calls (e.g., an MCMC inner loop) reuse one set of
+        # graph nodes instead of rebuilding them per call.
+        if df_val is not None and dim_val is not None:
+          # Both parameters are static, so this coefficient is a
+          # graph-construction-time constant; fold the two subtractions.
+          self._df_minus_dim_minus_1 = constant_op.constant(
+              np.asarray(df_val) - dim_val - 1., dtype=self.dtype)
+        else:
+          self._df_minus_dim_minus_1 = self.df - self.dimension - 1.
+        self._multi_gamma_seq = self._multi_gamma_sequence(
+            0.5 * self.df, self.dimension)
+        self._scale_sqrt_log_det = self.scale_operator_pd.sqrt_log_det()
+        # log|scale| = 2 log|sqrt(scale)|; entropy, mean_log_det and the
+        # normalizing constant all share the one determinant computation.
+        self._scale_log_det = 2. * self._scale_sqrt_log_det
+        self._log_norm_const = (
+            self.df * self._scale_sqrt_log_det +
+            0.5 * self.df * self.dimension * math.log(2.) +
+            self._multi_lgamma(0.5 * self.df, self.dimension))
+        # Lazily memoized by variance(); see its docstring.
+        self._cached_variance = None
+
   @property
   def inputs(self):
     """Dictionary of inputs provided at initialization."""
@@ -188,6 +384,11 @@ class _WishartOperatorPD(distribution.Distribution):
     """Boolean indicating if `Tensor` input/outputs are Cholesky factorized."""
     return self._cholesky_input_output_matrices
 
+  @property
+  def compute_dtype(self):
+    """Optional reduced precision for large intermediates, or `None`."""
+    return self._compute_dtype
+
   @property
   def dimension(self):
     """Dimension of underlying vector space. The `p` in `R^(p*p)`."""
@@ -242,55 +443,34 @@ class _WishartOperatorPD(distribution.Distribution):
         x = ops.convert_to_tensor(x, name='x')
         contrib_tensor_util.assert_same_float_dtype(
             (self.scale_operator_pd, x))
+        if self._dimension_static == 1:
+          # Scalar Wishart is a Gamma; use its closed-form density.
+          return self._log_prob_scalar_event(x)
         if self.cholesky_input_output_matrices:
           x_sqrt = x
+          # The factor's diagonal is directly available; reduce it here,
+          # while `x_sqrt` is still hot, rather than after the solve has
+          # streamed other data through cache.
+          # Complexity: O(nbk)
+          half_log_det_x = math_ops.reduce_sum(
+              math_ops.log(array_ops.batch_matrix_diag_part(x_sqrt)),
+              reduction_indices=[-1])
         else:
-          # Complexity: O(nbk^3)
-          x_sqrt = linalg_ops.batch_cholesky(x)
-
-        batch_shape = self.batch_shape()
-        event_shape = self.event_shape()
-        ndims = array_ops.rank(x_sqrt)
-        # sample_ndims = ndims - batch_ndims - event_ndims
-        sample_ndims = ndims - array_ops.shape(batch_shape)[0] - 2
-        sample_shape = array_ops.slice(
-            array_ops.shape(x_sqrt), [0], [sample_ndims])
+          # Complexity: O(nbk^3); the O(nbk) log-det reduction is fused with
+          # the factorization.
+          x_sqrt, half_log_det_x = _batch_cholesky_with_half_log_det(x)
 
         # We need to be able to pre-multiply each matrix by its corresponding
         # batch scale matrix.  Since a Distribution Tensor supports multiple
-        # samples per batch, this means we need to reshape the input matrix `x`
-        # so that the first b dimensions are batch dimensions and the last two
-        # are of shape [dimension, dimensions*number_of_samples]. Doing these
-        # gymnastics allows us to do a batch_solve.
+        # samples per batch, `sqrt_solve_broadcast` broadcasts the operator
+        # over the leading sample dimensions of `x_sqrt`.
         #
-        # After we're done with sqrt_solve (the batch operation) we need to undo
-        # this reshaping so what we're left with is a Tensor partitionable by
-        # sample, batch, event dimensions.
-
-        # Complexity: O(nbk^2) since transpose must access every element.
-        scale_sqrt_inv_x_sqrt = x_sqrt
-        perm = array_ops.concat(0, (math_ops.range(sample_ndims, ndims),
-                                    math_ops.range(0, sample_ndims)))
-        scale_sqrt_inv_x_sqrt = array_ops.transpose(scale_sqrt_inv_x_sqrt, perm)
-        shape = array_ops.concat(
-            0, (batch_shape,
-                (math_ops.cast(self.dimension, dtype=dtypes.int32), -1)))
-        scale_sqrt_inv_x_sqrt = array_ops.reshape(scale_sqrt_inv_x_sqrt, shape)
-
-        # Complexity: O(nbM*k) where M is the complexity of the operator solving
-        # a vector system.  E.g., for OperatorPDDiag, each solve is O(k), so
-        # this complexity is O(nbk^2). For OperatorPDCholesky, each solve is
-        # O(k^2) so this step has complexity O(nbk^3).
-        scale_sqrt_inv_x_sqrt = self.scale_operator_pd.sqrt_solve(
-            scale_sqrt_inv_x_sqrt)
-
-        # Undo make batch-op ready.
-        # Complexity: O(nbk^2)
-        shape = array_ops.concat(0, (batch_shape, event_shape, sample_shape))
-        scale_sqrt_inv_x_sqrt = array_ops.reshape(scale_sqrt_inv_x_sqrt, shape)
-        perm = array_ops.concat(0, (math_ops.range(ndims - sample_ndims, ndims),
-                                    math_ops.range(0, ndims - sample_ndims)))
-        scale_sqrt_inv_x_sqrt = array_ops.transpose(scale_sqrt_inv_x_sqrt, perm)
+        # Complexity: O(nbM*k) where M is the complexity of the operator
+        # solving a vector system.  E.g., for OperatorPDDiag, each solve is
+        # O(k), so this complexity is O(nbk^2). For OperatorPDCholesky, each
+        # solve is O(k^2) so this step has complexity O(nbk^3).
+        scale_sqrt_inv_x_sqrt = self.scale_operator_pd.sqrt_solve_broadcast(
+            x_sqrt)
 
         # Write V = SS', X = LL'. Then:
         # tr[inv(V) X] = tr[inv(S)' inv(S) L L']
@@ -299,19 +479,19 @@ class _WishartOperatorPD(distribution.Distribution):
         #              = sum_{ik} (inv(S) L)_{ik}^2
         # The second equality follows from the cyclic permutation property.
         # Complexity: O(nbk^2)
+        if self.compute_dtype is not None:
+          # Square the whitened observations in reduced precision; the cast
+          # back before reduce_sum keeps the accumulation in self.dtype.
+          scale_sqrt_inv_x_sqrt = math_ops.cast(
+              scale_sqrt_inv_x_sqrt, self.compute_dtype)
         trace_scale_inv_x = math_ops.reduce_sum(
-            math_ops.square(scale_sqrt_inv_x_sqrt),
+            math_ops.cast(math_ops.square(scale_sqrt_inv_x_sqrt), self.dtype),
             reduction_indices=[-2, -1])
 
-        # Complexity: O(nbk)
-        half_log_det_x = math_ops.reduce_sum(
-            math_ops.log(array_ops.batch_matrix_diag_part(x_sqrt)),
-            reduction_indices=[-1])
-
         # Complexity: O(nbk^2)
-        log_prob = ((self.df - self.dimension - 1.) * half_log_det_x -
+        log_prob = (self._df_minus_dim_minus_1 * half_log_det_x -
                     0.5 * trace_scale_inv_x -
-                    self.log_normalizing_constant())
+                    self._log_norm_const)
 
         # Set shape hints.
         # Try to merge what we know from the input then what we know from the
@@ -326,6 +506,35 @@ class _WishartOperatorPD(distribution.Distribution):
 
         return log_prob
 
+  def _log_prob_scalar_event(self, x):
+    """Closed-form log_prob for `dimension == 1`.
+
+    A scalar Wishart is `scale * Chi2(df)`, i.e.,
+    `Gamma(alpha=df/2, beta=1/(2*scale))`; its log-pdf needs no Cholesky,
+    solve, or transposes, just elementwise ops over the squeezed input.
+    """
+    x_scalar = array_ops.squeeze(x, squeeze_dims=[-2, -1])
+    if self.cholesky_input_output_matrices:
+      # The input is a Cholesky factor, i.e., the square root of the
+      # observation.
+      x_scalar = math_ops.square(x_scalar)
+    scale = array_ops.squeeze(
+        self.scale_operator_pd.to_dense(), squeeze_dims=[-2, -1])
+
+    # The cached normalizing constant reduces to
+    # 0.5 * df * log(2 * scale) + lgamma(0.5 * df) when k = 1.
+    log_prob = ((0.5 * self.df - 1.) * math_ops.log(x_scalar) -
+                0.5 * x_scalar / scale -
+                self._log_norm_const)
+
+    # Set shape hints.
+    if (log_prob.get_shape().ndims is not None and
+        self.get_batch_shape().ndims is not None and
+        self.get_batch_shape().ndims > 0):
+      log_prob.get_shape()[-self.get_batch_shape().ndims:].merge_with(
+          self.get_batch_shape())
+    return log_prob
+
   def sample_n(self, n, seed=None, name='sample'):
     # pylint: disable=line-too-long
     """Generate `n` samples.
@@ -337,6 +546,11 @@ class _WishartOperatorPD(distribution.Distribution):
     and [using a Gamma distribution to generate Chi2 random variates](
     https://en.wikipedia.org/wiki/Chi-squared_distribution#Gamma.2C_exponential.2C_and_related_distributions).
 
+    When `n` is statically known and large enough that the sampling
+    intermediates would exceed an internal memory budget, observations are
+    drawn in fixed-size chunks inside a loop; the result is identical in
+    distribution and peak memory stays bounded by the chunk size.
+
     Args:
       n: `Scalar` `Tensor` of type `int32` or `int64`, the number of
         observations to sample.
@@ -352,59 +566,16 @@ class _WishartOperatorPD(distribution.Distribution):
         n = ops.convert_to_tensor(n, name='n')
         if n.dtype != dtypes.int32:
           raise TypeError('n.dtype=%s which is not int32' % n.dtype)
-        batch_shape = self.batch_shape()
-        event_shape = self.event_shape()
-        batch_ndims = array_ops.shape(batch_shape)[0]
-
-        ndims = batch_ndims + 3  # sample_ndims=1, event_ndims=2
-        shape = array_ops.concat(0, ((n,), batch_shape, event_shape))
-
-        # Complexity: O(nbk^2)
-        x = random_ops.random_normal(shape=shape,
-                                     mean=0.,
-                                     stddev=1.,
-                                     dtype=self.dtype,
-                                     seed=seed)
-
-        # Complexity: O(nbk)
-        # This parametrization is equivalent to Chi2, i.e.,
-        # ChiSquared(k) == Gamma(alpha=k/2, beta=1/2)
-        g = random_ops.random_gamma(shape=(n,),
-                                    alpha=self._multi_gamma_sequence(
-                                        0.5 * self.df, self.dimension),
-                                    beta=0.5,
-                                    dtype=self.dtype,
-                                    seed=seed)
-
-        # Complexity: O(nbk^2)
-        x = array_ops.batch_matrix_band_part(x, -1, 0)  # Tri-lower.
-
-        # Complexity: O(nbk)
-        x = array_ops.batch_matrix_set_diag(x, math_ops.sqrt(g))
-
-        # Make batch-op ready.
-        # Complexity: O(nbk^2)
-        perm = array_ops.concat(0, (math_ops.range(1, ndims), (0,)))
-        x = array_ops.transpose(x, perm)
-        shape = array_ops.concat(0, (batch_shape, (event_shape[0], -1)))
-        x = array_ops.reshape(x, shape)
-
-        # Complexity: O(nbM) where M is the complexity of the operator solving a
-        # vector system.  E.g., for OperatorPDDiag, each matmul is O(k^2), so
-        # this complexity is O(nbk^2). For OperatorPDCholesky, each matmul is
-        # O(k^3) so this step has complexity O(nbk^3).
-        x = self.scale_operator_pd.sqrt_matmul(x)
-
-        # Undo make batch-op ready.
-        # Complexity: O(nbk^2)
-        shape = array_ops.concat(0, (batch_shape, event_shape, (n,)))
-        x = array_ops.reshape(x, shape)
-        perm = array_ops.concat(0, ((ndims-1,), math_ops.range(0, ndims-1)))
-        x = array_ops.transpose(x, perm)
-
-        if not self.cholesky_input_output_matrices:
-          # Complexity: O(nbk^3)
-          x = math_ops.batch_matmul(x, x, adj_y=True)
+        if self._dimension_static == 1:
+          # Scalar Wishart is a Gamma; sample it directly.
+          return self._sample_n_scalar_event(n, seed)
+
+        chunk_size = self._sample_chunk_size()
+        n_val = tensor_util.constant_value(n)
+        if (chunk_size is None or n_val is None or n_val <= chunk_size):
+          x = self._sample_n_dense(n, seed)
+        else:
+          x = self._sample_n_chunked(n, chunk_size, seed)
 
         # Set shape hints.
         if self.scale_operator_pd.get_shape().ndims is not None:
@@ -417,6 +588,186 @@ class _WishartOperatorPD(distribution.Distribution):
 
         return x
 
+  def _sample_chunk_size(self):
+    """Number of observations per chunk of `sample_n`, or `None`.
+
+    Derived from `_MAX_SAMPLE_CHUNK_BYTES` and the static size of one
+    observation across all batch members; `None` when the operator shape is
+    not fully known at graph construction time (in which case `sample_n`
+    materializes all `n` observations at once, as before).
+    """
+    shape = self.scale_operator_pd.get_shape()
+    if not shape.is_fully_defined():
+      return None
+    bytes_per_obs = int(np.prod(shape.as_list())) * self.dtype.size
+    return max(1, _MAX_SAMPLE_CHUNK_BYTES // bytes_per_obs)
+
+  def _sample_n_dense(self, n, seed):
+    """Draws all `n` observations in one pass; see `sample_n`."""
+    batch_shape = self.batch_shape()
+    event_shape = self.event_shape()
+    if self.get_batch_shape().ndims is not None:
+      # Rank is static, so the permutations below are Python lists folded
+      # into constants rather than range/concat ops evaluated per run.
+      batch_ndims = self.get_batch_shape().ndims
+    else:
+      batch_ndims = array_ops.shape(batch_shape)[0]
+
+    ndims = batch_ndims + 3  # sample_ndims=1, event_ndims=2
+
+    # Complexity: O(nbk^2)
+    x = self._sample_bartlett_factor(
+        n, batch_shape, event_shape, seed=seed)
+
+    # Make batch-op ready.
+    # Complexity: O(nbk^2)
+    if isinstance(ndims, int):
+      perm = list(range(1, ndims)) + [0]
+    else:
+      perm = array_ops.concat(0, (math_ops.range(1, ndims), (0,)))
+    x = array_ops.transpose(x, perm)
+    scale_shape = self.scale_operator_pd.get_shape()
+    if scale_shape.is_fully_defined():
+      # Reshape targets are Python lists (with -1 absorbing the sample
+      # dimension), folded into constants instead of cast/shape/concat ops.
+      shape = scale_shape.as_list()[:-1] + [-1]
+    else:
+      shape = array_ops.concat(0, (batch_shape, (event_shape[0], -1)))
+    x = array_ops.reshape(x, shape)
+
+    # Complexity: O(nbM) where M is the complexity of the operator solving a
+    # vector system.  E.g., for OperatorPDDiag, each matmul is O(k^2), so
+    # this complexity is O(nbk^2). For OperatorPDCholesky, each matmul is
+    # O(k^3) so this step has complexity O(nbk^3).
+    x = self.scale_operator_pd.sqrt_matmul(x)
+
+    # Undo make batch-op ready.
+    # Complexity: O(nbk^2)
+    if scale_shape.is_fully_defined():
+      shape = scale_shape.as_list() + [-1]
+    else:
+      shape = array_ops.concat(0, (batch_shape, event_shape, (n,)))
+    x = array_ops.reshape(x, shape)
+    if isinstance(ndims, int):
+      perm = [ndims - 1] + list(range(0, ndims - 1))
+    else:
+      perm = array_ops.concat(0, ((ndims-1,), math_ops.range(0, ndims-1)))
+    x = array_ops.transpose(x, perm)
+
+    if not self.cholesky_input_output_matrices:
+      # Complexity: O(nbk^3)
+      x = _symmetric_square(x, compute_dtype=self.compute_dtype)
+
+    return x
+
+  def _sample_n_chunked(self, n, chunk_size, seed):
+    """Draws `n` observations `chunk_size` at a time inside a `while_loop`.
+
+    Peak memory for the sampling intermediates is then proportional to
+    `chunk_size` rather than `n`.  The loop runs with
+    `parallel_iterations=1` since each iteration already saturates the
+    batched kernels; back-prop stays enabled so reparameterized gradients
+    still flow through each chunk.
+    """
+    num_chunks = math_ops.cast(
+        math_ops.ceil(math_ops.cast(n, dtypes.float64) / chunk_size),
+        dtypes.int32)
+    chunk_n = constant_op.constant(chunk_size, dtype=dtypes.int32)
+
+    def body(i, ta):
+      # The RNG ops are stateful, so each iteration draws fresh variates
+      # even though the ops (and their seeds) are built once.
+      return i + 1, ta.write(i, self._sample_n_dense(chunk_n, seed))
+
+    _, ta = control_flow_ops.while_loop(
+        cond=lambda i, _: i < num_chunks,
+        body=body,
+        loop_vars=[
+            constant_op.constant(0, dtype=dtypes.int32),
+            tensor_array_ops.TensorArray(dtype=self.dtype, size=num_chunks)],
+        parallel_iterations=1)
+    x = ta.concat()
+
+    # The final chunk may overshoot; slice back down to `n` observations.
+    ndims = array_ops.rank(x)
+    begin = array_ops.zeros([ndims], dtype=dtypes.int32)
+    size = array_ops.concat(
+        0, (array_ops.reshape(n, [1]),
+            -array_ops.ones([ndims - 1], dtype=dtypes.int32)))
+    return array_ops.slice(x, begin, size)
+
+  def _sample_bartlett_factor(self, n, batch_shape, event_shape, seed=None):
+    """Samples the lower-triangular Bartlett factor.
+
+    The Bartlett factor has iid standard normals strictly below the diagonal
+    and the square root of Chi2 (i.e., Gamma) variates on the diagonal.  A
+    fused kernel would write only the k(k+1)/2 nonzero entries; lacking such an
+    op, the draws and the masking passes are grouped here, back to back, so
+    this is the single site to swap if/when a fused Bartlett sampler exists.
+
+    Args:
+      n: `Scalar` `Tensor` of type `int32`, the number of observations.
+      batch_shape: 1-D `int32` `Tensor`, i.e., `self.batch_shape()`.
+      event_shape: 1-D `int32` `Tensor`, i.e., `self.event_shape()`.
+      seed: Python integer; random number generator seed.
+
+    Returns:
+      bartlett: a lower-triangular `Tensor` of shape
+        `(n,) + self.batch_shape + self.event_shape`.
+    """
+    shape = array_ops.concat(0, ((n,), batch_shape, event_shape))
+
+    # Complexity: O(nbk^2)
+    x = random_ops.random_normal(shape=shape,
+                                 mean=0.,
+                                 stddev=1.,
+                                 dtype=self.dtype,
+                                 seed=seed)
+
+    # Complexity: O(nbk)
+    # This parametrization is equivalent to Chi2, i.e.,
+    # ChiSquared(k) == Gamma(alpha=k/2, beta=1/2)
+    #
+    # Two random ops given the same op-level seed resolve to the same
+    # (graph, op) seed pair and hence the same Philox stream; derive a
+    # distinct seed for the gamma draw so it is independent of the normals.
+    g = random_ops.random_gamma(shape=(n,),
+                                alpha=self._multi_gamma_seq,
+                                beta=0.5,
+                                dtype=self.dtype,
+                                seed=None if seed is None else seed + 1)
+
+    # Complexity: O(nbk^2)
+    x = array_ops.batch_matrix_band_part(x, -1, 0)  # Tri-lower.
+
+    # Complexity: O(nbk)
+    return array_ops.batch_matrix_set_diag(x, math_ops.sqrt(g))
+
+  def _sample_n_scalar_event(self, n, seed):
+    """Closed-form sampler for `dimension == 1`.
+
+    A scalar Wishart is `scale * Chi2(df)`, i.e.,
+    `Gamma(alpha=df/2, beta=1/(2*scale))`; draw the Gamma variates directly
+    instead of running the Bartlett/matmul pipeline on 1x1 matrices.
+    """
+    scale = array_ops.squeeze(
+        self.scale_operator_pd.to_dense(), squeeze_dims=[-2, -1])
+    x = random_ops.random_gamma(shape=(n,),
+                                alpha=0.5 * self.df,
+                                beta=0.5 / scale,
+                                dtype=self.dtype,
+                                seed=seed)
+    if self.cholesky_input_output_matrices:
+      x = math_ops.sqrt(x)
+    x = array_ops.expand_dims(array_ops.expand_dims(x, -1), -1)
+
+    # Set shape hints.
+    if self.scale_operator_pd.get_shape().ndims is not None:
+      x.set_shape(tensor_shape.TensorShape(
+          [tensor_util.constant_value(n)] +
+          self.scale_operator_pd.get_shape().as_list()))
+    return x
+
   def cdf(self, value, name='cdf'):
     """Cumulative distribution function."""
     raise NotImplementedError('cdf is not implemented')
@@ -430,7 +781,7 @@ class _WishartOperatorPD(distribution.Distribution):
     half_dp1 = 0.5 * self.dimension + 0.5
     half_df = 0.5 * self.df
     return (self.dimension * (half_df + half_dp1 * math.log(2.)) +
-            half_dp1 * self.scale_operator_pd.log_det() +
+            half_dp1 * self._scale_log_det +
             self._multi_lgamma(half_df, self.dimension) +
             (half_dp1 - half_df) * self._multi_digamma(half_df, self.dimension))
 
@@ -447,11 +798,12 @@ class _WishartOperatorPD(distribution.Distribution):
     """Mode of the distribution."""
     with ops.name_scope(self.name):
       with ops.name_scope(name, values=list(self.inputs.values())):
-        s = self.df - self.dimension - 1.
-        s = math_ops.select(
-            math_ops.less(s, 0.),
-            constant_op.constant(float('NaN'), dtype=self.dtype, name='nan'),
-            s)
+        # Branchless NaN injection: sqrt(s) is NaN exactly when s < 0, and
+        # adding 0 * NaN poisons only those entries (the mode is undefined
+        # there); for s >= 0 the term is exactly zero.  Avoids the select,
+        # which lowers to a predicated load on elementwise backends.
+        s = self._df_minus_dim_minus_1
+        s += 0. * math_ops.sqrt(s)
         if self.cholesky_input_output_matrices:
           return math_ops.sqrt(s) * self.scale_operator_pd.sqrt_to_dense()
         else:
@@ -465,7 +817,7 @@ class _WishartOperatorPD(distribution.Distribution):
           raise ValueError(
               'Computing std. dev. when is cholesky_input_output_matrices=True '
               'does not make sense.')
-        return linalg_ops.batch_cholesky(self.variance())
+        return _blocked_batch_cholesky(self.variance())
 
   def variance(self, name='variance'):
     """Variance of the Wishart distribution.
@@ -479,21 +831,33 @@ class _WishartOperatorPD(distribution.Distribution):
     This function returns the diagonal of the Covariance matrix but shaped
     as a `dimension x dimension` matrix.
 
+    The result depends only on (df, scale), so it is memoized: repeated
+    `variance`/`std` calls (e.g., inside an MCMC loop body) return the same
+    `Tensor` rather than rebuilding the subgraph.  As with any memoized
+    member, construct the distribution once outside hot loops.
+
     Args:
-      name: The name of this op.
+      name: The name of this op.  Only used on the first call.
 
     Returns:
       variance: `Tensor` of dtype `self.dtype`.
     """
+    if self._cached_variance is not None:
+      return self._cached_variance
     with ops.name_scope(self.name):
       with ops.name_scope(name, values=list(self.inputs.values())):
-        x = math_ops.sqrt(self.df) * self.scale_operator_pd.to_dense()
-        d = array_ops.expand_dims(array_ops.batch_matrix_diag_part(x), -1)
-        v = math_ops.square(x) + math_ops.batch_matmul(d, d, adj_y=True)
+        # Var[X]_{ij} = df (S_{ij}^2 + S_{ii} S_{jj}); the rank-1 term is a
+        # broadcast multiply of the diagonal against itself, so no batched
+        # matmul (or the sqrt/square pair it required) is needed.
+        s = self.scale_operator_pd.to_dense()
+        d = array_ops.batch_matrix_diag_part(s)
+        v = self.df * (math_ops.square(s) +
+                       array_ops.expand_dims(d, -1) *
+                       array_ops.expand_dims(d, -2))
         if self.cholesky_input_output_matrices:
-          return linalg_ops.batch_cholesky(v)
-        else:
-          return v
+          v = _blocked_batch_cholesky(v)
+        self._cached_variance = v
+        return v
 
   def mean_log_det(self, name='mean_log_det'):
     """Computes E[log(det(X))] under this Wishart distribution."""
@@ -501,20 +865,37 @@ class _WishartOperatorPD(distribution.Distribution):
       with ops.name_scope(name, values=list(self.inputs.values())):
         return (self._multi_digamma(0.5 * self.df, self.dimension) +
                 self.dimension * math.log(2.) +
-                self.scale_operator_pd.log_det())
+                self._scale_log_det)
 
   def log_normalizing_constant(self, name='log_normalizing_constant'):
-    """Computes the log normalizing constant, log(Z)."""
-    with ops.name_scope(self.name):
-      with ops.name_scope(name, values=list(self.inputs.values())):
-        return (self.df * self.scale_operator_pd.sqrt_log_det() +
-                0.5 * self.df * self.dimension * math.log(2.) +
-                self._multi_lgamma(0.5 * self.df, self.dimension))
+    """Computes the log normalizing constant, log(Z).
+
+    log(Z) depends only on `df` and `scale`, so it is built once at
+    construction time and the cached `Tensor` is returned here.
+    """
+    return self._log_norm_const
 
   def _multi_gamma_sequence(self, a, p, name='multi_gamma_sequence'):
     """Creates sequence used in multivariate (di)gamma; shape = shape(a)+[p]."""
     with ops.name_scope(self.name):
       with ops.name_scope(name, values=[a, p]):
+        a = ops.convert_to_tensor(a, dtype=self.dtype)
+        p_val = tensor_util.constant_value(ops.convert_to_tensor(p))
+        if p_val is not None:
+          # Static p (the common case): the linspace is a construction-time
+          # constant, and when a is static too the whole sequence is.
+          p_val = int(p_val)
+          seq = np.linspace(
+              0., 0.5 - 0.5 * p_val, p_val,
+              dtype=self.dtype.as_numpy_dtype)
+          a_val = tensor_util.constant_value(a)
+          if a_val is not None:
+            return constant_op.constant(
+                np.asarray(a_val, dtype=self.dtype.as_numpy_dtype)[
+                    ..., np.newaxis] + seq,
+                dtype=self.dtype)
+          return (constant_op.constant(seq, dtype=self.dtype) +
+                  array_ops.expand_dims(a, [-1]))
         # Linspace only takes scalars, so we'll add in the offset afterwards.
         seq = math_ops.linspace(
             constant_op.constant(0., dtype=self.dtype),
@@ -522,10 +903,39 @@ class _WishartOperatorPD(distribution.Distribution):
             math_ops.cast(p, dtypes.int32))
         return seq + array_ops.expand_dims(a, [-1])
 
+  def _static_multi_gamma_seq(self, a, p):
+    """Multivariate (di)gamma sequence as a numpy array, or `None`.
+
+    Possible when `a` and `p` are both statically known.  In that case no
+    gradient can flow through either, so the O(p) special-function
+    evaluations downstream may run once at graph construction instead of
+    emitting linspace/broadcast/special-function/reduce nodes; for small `p`
+    these four nodes cost more in dispatch than in flops.
+    """
+    a_val = tensor_util.constant_value(
+        ops.convert_to_tensor(a, dtype=self.dtype))
+    p_val = tensor_util.constant_value(ops.convert_to_tensor(p))
+    if a_val is None or p_val is None:
+      return None
+    p_val = int(p_val)
+    seq = (np.asarray(a_val, dtype=np.float64)[..., np.newaxis] +
+           np.linspace(0., 0.5 - 0.5 * p_val, p_val))
+    if np.any(seq <= 0.):
+      # Outside the special functions' domain; let the graph ops handle it.
+      return None
+    return seq
+
   def _multi_lgamma(self, a, p, name='multi_lgamma'):
     """Computes the log multivariate gamma function; log(Gamma_p(a))."""
     with ops.name_scope(self.name):
       with ops.name_scope(name, values=[a, p]):
+        seq = self._static_multi_gamma_seq(a, p)
+        if seq is not None:
+          p_val = seq.shape[-1]
+          return constant_op.constant(
+              0.25 * p_val * (p_val - 1.) * math.log(math.pi) +
+              np.vectorize(math.lgamma)(seq).sum(axis=-1),
+              dtype=self.dtype)
         seq = self._multi_gamma_sequence(a, p)
         return (0.25 * p * (p - 1.) * math.log(math.pi) +
                 math_ops.reduce_sum(math_ops.lgamma(seq),
@@ -535,6 +945,10 @@ class _WishartOperatorPD(distribution.Distribution):
     """Computes the multivariate digamma function; Psi_p(a)."""
     with ops.name_scope(self.name):
       with ops.name_scope(name, values=[a, p]):
+        seq = self._static_multi_gamma_seq(a, p)
+        if seq is not None:
+          return constant_op.constant(
+              np.vectorize(_digamma)(seq).sum(axis=-1), dtype=self.dtype)
         seq = self._multi_gamma_sequence(a, p)
         return math_ops.reduce_sum(math_ops.digamma(seq),
                                    reduction_indices=(-1,))
@@ -609,6 +1023,7 @@ class WishartCholesky(_WishartOperatorPD):
                cholesky_input_output_matrices=False,
                allow_nan_stats=False,
                validate_args=True,
+               compute_dtype=None,
                name='Wishart'):
     """Construct Wishart distributions.
 
@@ -629,6 +1044,9 @@ class WishartCholesky(_WishartOperatorPD):
       validate_args: Whether to validate input with asserts. If `validate_args`
         is `False`, and the inputs are invalid, correct behavior is not
         guaranteed.
+      compute_dtype: Optional floating-point `DType`. If set, the largest
+        dtype-safe intermediates of `log_prob` and `sample_n` are computed in
+        this precision, with reductions accumulated in `self.dtype`.
       name: The name scope to give class member ops.
     """
     super(WishartCholesky, self).__init__(
@@ -638,6 +1056,7 @@ class WishartCholesky(_WishartOperatorPD):
         cholesky_input_output_matrices=cholesky_input_output_matrices,
         allow_nan_stats=allow_nan_stats,
         validate_args=validate_args,
+        compute_dtype=compute_dtype,
         name=name)
 
 
@@ -706,6 +1125,7 @@ class WishartFull(_WishartOperatorPD):
                cholesky_input_output_matrices=False,
                allow_nan_stats=False,
                validate_args=True,
+               compute_dtype=None,
                name='Wishart'):
     """Construct Wishart distributions.
 
@@ -726,6 +1146,9 @@ class WishartFull(_WishartOperatorPD):
       validate_args: Whether to validate input with asserts. If `validate_args`
         is `False`, and the inputs are invalid, correct behavior is not
         guaranteed.
+      compute_dtype: Optional floating-point `DType`. If set, the largest
+        dtype-safe intermediates of `log_prob` and `sample_n` are computed in
+        this precision, with reductions accumulated in `self.dtype`.
       name: The name scope to give class member ops.
     """
     super(WishartFull, self).__init__(
@@ -735,4 +1158,5 @@ class WishartFull(_WishartOperatorPD):
         cholesky_input_output_matrices=cholesky_input_output_matrices,
         allow_nan_stats=allow_nan_stats,
         validate_args=validate_args,
+        compute_dtype=compute_dtype,
         name=name)